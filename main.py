@@ -35,10 +35,10 @@ I consider this to be a prototype for how such a workflow might be implemented a
 system I believe it would need (at least) the following improvements that are outside the time scope of this work:
 
 1.  Automated unit tests.  Some manual testing has been performed but it was not rigorous.
-2.  Parallelization.  The workflow performs only serialized access to RSS feeds.  A concurrent worker model
-    implemented either internally or externalized to more appropriate infrastructure would be very desirable.
-3.  Robustness.  There is basic error detection and reporting but no mechanisms for retrying failed communication
-    attempts beyond what underlying modules automatically provide.
+2.  Parallelization.  Work units and their RSS feeds are now queried concurrently via asyncio within a single
+    process.  A worker model externalized to more appropriate infrastructure may still be desirable at scale.
+3.  Robustness.  There is basic error detection and reporting, and failed communication attempts are retried a
+    fixed number of times with exponential backoff, but nothing more sophisticated such as circuit breaking.
 4.  Scheduling.  There's no provision for automating the scheduling of the workflow.
 5.  Logging.  Only rudimentary logging has been implemented.
 6.  Metrics.  There are no performance or accounting metrics being collected.
@@ -49,190 +49,655 @@ __author__ = "David Hinson (27-SEP-2020)"
 __email__ = "dhinson@sjmail.us"
 __status__ = "Prototype"
 
-import collections
+import asyncio
+import atexit
+import contextlib
+import email.utils
 import getopt
+import json
 import logging
+import os
+import pickle
 import re
 import sys
-import xml.etree.ElementTree as ET
-from functools import reduce
+import time
+import weakref
+from http import HTTPStatus
+from urllib.parse import urlsplit
 
-import requests
+import aiohttp
+import orjson
+from lxml import etree as ET
 
-# Template for NIH MeSH service tree query:
+# Template for NIH MeSH service tree query of a batch of descriptors:
 Treenum_query_template = '''
 PREFIX meshv: <http://id.nlm.nih.gov/mesh/vocab#>
 PREFIX mesh: <http://id.nlm.nih.gov/mesh/>
-SELECT ?treeNum
+SELECT ?d ?treeNum
 FROM <http://id.nlm.nih.gov/mesh>
-WHERE {{ mesh:{descriptor_id} meshv:treeNumber ?treeNum }}
-ORDER BY ?treeNum
+WHERE {{ VALUES ?d {{ {descriptors} }} ?d meshv:treeNumber ?treeNum }}
+ORDER BY ?d ?treeNum
+LIMIT {limit}
+OFFSET {offset}
 '''
+# Maximum number of descriptors per tree query, keeping the query URL within service limits:
+Treenum_query_batch_size = 100
+# Number of result rows requested per page of a tree query, which must not exceed the service's cap on rows returned:
+Treenum_query_page_size = 1000
+
+# Result element tag and compiled XPaths for parsing NIH MeSH service tree query results:
+Sparql_result_tag = '{http://www.w3.org/2005/sparql-results#}result'
+Sparql_namespaces = {'s': 'http://www.w3.org/2005/sparql-results#'}
+Sparql_descriptor_uri_xpath = ET.XPath("string(s:binding[@name='d']/s:uri)", namespaces=Sparql_namespaces)
+Sparql_treenum_uri_xpath = ET.XPath("string(s:binding[@name='treeNum']/s:uri)", namespaces=Sparql_namespaces)
+
+# XML parser options for service responses, which are trusted with neither entities nor unbounded documents:
+Xml_parser_options = {'resolve_entities': False, 'huge_tree': False}
 
 # Regex for parsing MeSH base tree IDs:
-Base_tree_regex = re.compile('http://id.nlm.nih.gov/mesh/([^.]+)')
+Base_tree_regex = re.compile(r'http://id.nlm.nih.gov/mesh/([^.]+)')
 # Regex for paring MeSH descriptor IDs:
-Descriptor_id_regex = re.compile('http://id.nlm.nih.gov/mesh/(\D\d+)')
+Descriptor_id_regex = re.compile(r'http://id.nlm.nih.gov/mesh/(\D\d+)')
+# Regex for characters removed from descriptor labels when normalizing them:
+Label_punctuation_regex = re.compile(r'[^\w\s]+')
+
+# Handlers for RSS feed services indexed by feed URL, each comprising a builder of the service API query parameters
+# and the element path of channel items below the document root.  As new RSS feed services are identified and added
+# appropriate handlers must be added here.
+FeedHandlers = {
+    'https://clinicaltrials.gov/ct2/results/rss.xml': {
+        'params': 'lup_d={inactivity_period_days}&cond={disease}&count={limit}'.format,
+        'item_path': ['channel', 'item'],
+    }
+}
 
-# Templates for RSS feed service API query parameters indexed by feed URL.  As new RSS feed services are identified and
-# added appropriate templates must be added here.
-FeedQueryParams = {
-    'https://clinicaltrials.gov/ct2/results/rss.xml': 'lup_d={inactivity_period_days}&cond={disease}&count={limit}'
+# Maximum number of channel items requested from an RSS feed when counting them:
+Feed_item_limit = 1000
+
+# Process-wide caches of MeSH service results.  Resolved descriptors are keyed by normalized descriptor label, both as
+# supplied and as resolved by MeSH.  Labels not known to MeSH are recorded exactly as supplied, as their normalized form
+# may equal that of a known label.  Disease classifications are keyed by descriptor ID.  Only results of successful
+# queries are cached.
+Mesh_descriptor_cache = {}
+Mesh_unknown_labels = set()
+Mesh_disease_cache = {}
+# Process-wide index of MeSH descriptor labels already resolved and classified as diseases, which need no further
+# lookup, to their descriptor IDs so that they can be checked against refreshed MeSH tree indexes:
+Mesh_disease_labels = {}
+# File in which the MeSH caches are persisted between runs:
+Mesh_cache_file = 'mesh_cache.pkl'
+
+# URL template of the annual NIH MeSH descriptor file release:
+Mesh_tree_url_template = 'https://nlmpubs.nlm.nih.gov/projects/mesh/MESH_FILES/xmlmesh/desc{year}.xml'
+# Local index of MeSH descriptor IDs to their tree numbers, built from the descriptor file:
+Mesh_tree = {}
+# File in which the MeSH tree index is persisted, the age in days after which it is rebuilt, and the days to wait before
+# trying again should rebuilding fail:
+Mesh_tree_file = 'mesh_tree.pkl'
+Mesh_tree_max_age_days = 30
+Mesh_tree_retry_days = 1
+
+# Process-wide cache of RSS feed query validators and results, keyed by query URL, for use in conditional requests.
+# Each entry records the ETag and Last-Modified response headers and the channel item count.  Queries for only the
+# existence of channel items request a single item, so have their own keys, and record a count of at most one.
+Feed_cache = {}
+# File in which the RSS feed cache is persisted between runs:
+Feed_cache_file = 'feed_cache.json'
+
+# Total time allowed for any single HTTP request, in seconds:
+Request_timeout_seconds = 10
+# Maximum number of units of work evaluated concurrently:
+Max_concurrent_work_units = 32
+# Headers sent with every HTTP request; responses are decompressed transparently:
+Request_headers = {'Accept-Encoding': 'gzip, deflate'}
+# Maximum number of pooled, kept-alive connections to any single host:
+Connections_per_host = 32
+# Limits on requests to service hosts, as tuples of the maximum concurrent requests and the maximum rate in requests per
+# second (None if unlimited), respecting the hosts' usage policies.  Other hosts are limited to the connection pool
+# size.
+Host_request_limits = {
+    'id.nlm.nih.gov': (3, 3),
+    'clinicaltrials.gov': (10, None),
 }
+# Request throttles of each event loop, indexed by host:
+Host_throttles = weakref.WeakKeyDictionary()
+# Retry policy for failed HTTP requests; the delay before retry n (from 0) is Retry_backoff_seconds * 2 ** n, or longer
+# if the host asks for it via a Retry-After response header, up to Retry_after_max_seconds:
+Retry_total = 3
+Retry_backoff_seconds = 0.3
+Retry_after_max_seconds = 60
+Retry_status_codes = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE,
+                      HTTPStatus.GATEWAY_TIMEOUT)
+# Size of the chunks in which streamed HTTP responses are read, in bytes:
+Stream_chunk_size = 16 * 1024
+
+
+def load_mesh_cache():
+    """
+    Loads the MeSH caches persisted by a previous run, if any.
+    """
+    try:
+        with open(Mesh_cache_file, 'rb') as cache_file:
+            persisted = pickle.load(cache_file)
+        # Earlier caches recorded unknown labels as empty descriptors under normalized labels, which are discarded:
+        Mesh_descriptor_cache.update((cache_key, mesh_descriptor) for cache_key, mesh_descriptor
+                                     in persisted['descriptors'].items() if mesh_descriptor)
+        Mesh_unknown_labels.update(persisted.get('unknown_labels', ()))
+        Mesh_disease_cache.update(persisted['diseases'])
+        Mesh_disease_labels.update(persisted.get('disease_label_ids', {}))
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logging.warning('Unable to load MeSH cache [{cache_file}]: {exc}'.format(cache_file=Mesh_cache_file, exc=exc))
 
 
-def fetch_mesh_descriptor(descriptor_label):
+def save_mesh_cache():
     """
-    Fetches the Medical Subject Heading (MeSH) descriptor for the provided descriptor label from the NIH MeSH service.
+    Persists the MeSH caches for use by subsequent runs.
+    """
+    try:
+        with open(Mesh_cache_file, 'wb') as cache_file:
+            pickle.dump({'descriptors': Mesh_descriptor_cache, 'unknown_labels': Mesh_unknown_labels,
+                         'diseases': Mesh_disease_cache, 'disease_label_ids': Mesh_disease_labels}, cache_file)
+    except Exception as exc:
+        logging.warning('Unable to save MeSH cache [{cache_file}]: {exc}'.format(cache_file=Mesh_cache_file, exc=exc))
+
+
+class HostThrottle:
+    """
+    Limits the number of concurrent requests to a host and spaces the start of successive request attempts to keep
+    within a maximum request rate.  For use as an async context manager around each request, within which wait_turn
+    must be awaited before each attempt, retries included.
+    """
+    def __init__(self, max_concurrent, max_per_second=None):
+        self.__semaphore = asyncio.Semaphore(max_concurrent)
+        self.__min_interval = 1 / max_per_second if max_per_second else 0
+        self.__next_start = 0
+
+    async def __aenter__(self):
+        await self.__semaphore.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.__semaphore.release()
+
+    async def wait_turn(self):
+        # Reserve the next start time before waiting for it so that concurrent attempts are spaced in turn:
+        now = asyncio.get_running_loop().time()
+        start = max(now, self.__next_start)
+        self.__next_start = start + self.__min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def defer(self, seconds):
+        # Hold back all attempts, not only the deferring one, as the host is pushing back:
+        self.__next_start = max(self.__next_start, asyncio.get_running_loop().time() + seconds)
+
+
+def get_host_throttle(host):
+    """
+    Gets the request throttle of the provided host for the running event loop, creating it if necessary.
+    :param host: Service host name
+    :return: Host request throttle
+    """
+    throttles = Host_throttles.setdefault(asyncio.get_running_loop(), {})
+    if host not in throttles:
+        throttles[host] = HostThrottle(*Host_request_limits.get(host, (Connections_per_host,)))
+    return throttles[host]
+
+
+def get_retry_after_seconds(response):
+    """
+    Gets the delay requested by a response's Retry-After header, given either in seconds or as an HTTP date.
+    :param response: HTTP response
+    :return: Requested delay in seconds, capped at Retry_after_max_seconds, or 0 if none was requested
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        return 0
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            seconds = 0
+    return min(max(seconds, 0), Retry_after_max_seconds)
+
+
+@contextlib.asynccontextmanager
+async def http_get(session, url, **kwargs):
+    """
+    Issues an HTTP GET request within the request limits of the URL's host, retrying connection failures, timeouts
+    and transient server errors with exponential backoff, or after any delay the host requests.  Retries are subject
+    to the host's request limits too.  For use as an async context manager yielding the final response.
+    :param session: HTTP client session
+    :param url: Request URL
+    :param kwargs: Additional request arguments
+    """
+    throttle = get_host_throttle(urlsplit(url).hostname)
+    async with throttle:
+        for attempt in range(Retry_total + 1):
+            await throttle.wait_turn()
+            try:
+                response = await session.get(url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == Retry_total:
+                    raise
+            else:
+                if response.status not in Retry_status_codes or attempt == Retry_total:
+                    break
+                throttle.defer(get_retry_after_seconds(response))
+                response.release()
+            logging.debug('Retrying call to {url}'.format(url=url))
+            await asyncio.sleep(Retry_backoff_seconds * 2 ** attempt)
+        async with response:
+            yield response
+
+
+def load_feed_cache():
+    """
+    Loads the RSS feed cache persisted by a previous run, if any.
+    """
+    try:
+        with open(Feed_cache_file) as cache_file:
+            Feed_cache.update(json.load(cache_file))
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logging.warning('Unable to load feed cache [{cache_file}]: {exc}'.format(cache_file=Feed_cache_file, exc=exc))
+
+
+def save_feed_cache():
+    """
+    Persists the RSS feed cache for use by subsequent runs.
+    """
+    try:
+        with open(Feed_cache_file, 'w') as cache_file:
+            json.dump(Feed_cache, cache_file)
+    except Exception as exc:
+        logging.warning('Unable to save feed cache [{cache_file}]: {exc}'.format(cache_file=Feed_cache_file, exc=exc))
+
+
+def load_mesh_tree():
+    """
+    Loads the persisted MeSH tree index, if not already loaded.  A stale index is loaded too, so that it continues to
+    serve should it fail to be refreshed.
+    :return: True if the persisted index is current, False if it is missing or stale and should be refreshed
+    """
+    result = False
+    try:
+        mesh_tree_age_seconds = time.time() - os.path.getmtime(Mesh_tree_file)
+        if not Mesh_tree:
+            with open(Mesh_tree_file, 'rb') as tree_file:
+                Mesh_tree.update(pickle.load(tree_file))
+        result = mesh_tree_age_seconds < Mesh_tree_max_age_days * 24 * 60 * 60
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logging.warning('Unable to load MeSH tree [{tree_file}]: {exc}'.format(tree_file=Mesh_tree_file, exc=exc))
+    return result
+
+
+def defer_mesh_tree_refresh():
+    """
+    Defers the next attempt to refresh the MeSH tree index by Mesh_tree_retry_days, by backdating the persisted index so
+    that it only then becomes stale.  If there is no persisted index an empty one is persisted in its place.
+    """
+    try:
+        if not os.path.exists(Mesh_tree_file):
+            with open(Mesh_tree_file, 'wb') as tree_file:
+                pickle.dump({}, tree_file)
+        backdated = time.time() - (Mesh_tree_max_age_days - Mesh_tree_retry_days) * 24 * 60 * 60
+        os.utime(Mesh_tree_file, (backdated, backdated))
+    except Exception as exc:
+        logging.warning('Unable to defer MeSH tree refresh [{tree_file}]: {exc}'
+                        .format(tree_file=Mesh_tree_file, exc=exc))
+
+
+async def refresh_mesh_tree(session):
+    """
+    Rebuilds and persists the MeSH tree index from the current NIH MeSH descriptor file.  The file is large, so it is
+    parsed as it streams in, discarding each descriptor record once indexed.  Should the rebuild fail, any existing
+    index is kept and the next attempt deferred.
+    :param session: HTTP client session
+    """
+    mesh_tree_url = Mesh_tree_url_template.format(year=time.gmtime().tm_year)
+    logging.info('Refreshing MeSH tree from {url}'.format(url=mesh_tree_url))
+    mesh_tree = {}
+    try:
+        started = time.monotonic()
+        # Only a stalled read, not the whole download, is subject to the usual request timeout:
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=Request_timeout_seconds)
+        async with http_get(session, mesh_tree_url, timeout=timeout) as response:
+            if response.status == HTTPStatus.OK:
+                parser = ET.XMLPullParser(['end'], tag='DescriptorRecord', **Xml_parser_options)
+                async for chunk in response.content.iter_chunked(Stream_chunk_size):
+                    parser.feed(chunk)
+                    for _, record in parser.read_events():
+                        mesh_tree[record.findtext('DescriptorUI')] = [
+                            tree_number.text for tree_number in record.iterfind('TreeNumberList/TreeNumber')]
+                        record.clear()
+                        while record.getprevious() is not None:
+                            del record.getparent()[0]
+                parser.close()
+                logging.debug('Call to {url} took {seconds} seconds'
+                              .format(url=mesh_tree_url, seconds=time.monotonic() - started))
+            else:
+                logging.error('Call to {url} failed with status {status}'
+                              .format(url=mesh_tree_url, status=response.status))
+    except Exception as exc:
+        logging.error(exc)
+        mesh_tree = {}
+    if not mesh_tree:
+        logging.warning('Unable to refresh MeSH tree; retrying in {days} day(s)'.format(days=Mesh_tree_retry_days))
+        defer_mesh_tree_refresh()
+    else:
+        Mesh_tree.clear()
+        Mesh_tree.update(mesh_tree)
+        try:
+            with open(Mesh_tree_file, 'wb') as tree_file:
+                pickle.dump(Mesh_tree, tree_file)
+        except Exception as exc:
+            logging.warning('Unable to save MeSH tree [{tree_file}]: {exc}'.format(tree_file=Mesh_tree_file, exc=exc))
+
+
+def revalidate_mesh_disease_labels():
+    """
+    Withdraws known MeSH disease descriptor labels whose descriptors the MeSH tree index no longer places in the MeSH
+    Diseases tree, so that they are looked up and classified afresh.  Descriptors absent from the index, e.g. those
+    newer than its release and classified by the NIH MeSH RDF service instead, are left as they are.
+    """
+    for mesh_label, descriptor_id in list(Mesh_disease_labels.items()):
+        tree_numbers = Mesh_tree.get(descriptor_id)
+        if tree_numbers is not None and not any(tree_number.startswith('C') for tree_number in tree_numbers):
+            del Mesh_disease_labels[mesh_label]
+            Mesh_disease_cache.pop(descriptor_id, None)
+            logging.debug('Withdrew [{mesh_label}] as a known MeSH disease descriptor label'
+                          .format(mesh_label=mesh_label))
+
+
+def normalize_label(descriptor_label):
+    """
+    Normalizes a descriptor label so that variations in case, punctuation and whitespace share a cache key.
+    :param descriptor_label: Descriptor label
+    :return: Normalized descriptor label
+    """
+    return ' '.join(Label_punctuation_regex.sub('', descriptor_label.casefold()).split())
+
+
+async def lookup_mesh_descriptors(session, descriptor_label, match, limit):
+    """
+    Looks up the Medical Subject Heading (MeSH) descriptors matching the provided descriptor label with the NIH MeSH
+    service.
+    :param session: HTTP client session
     :param descriptor_label: Speculative name of a descriptor label
-    :return: MeSH descriptor object if the descriptor label is know, otherwise empty dict
+    :param match: Match type, e.g. 'exact' or 'contains'
+    :param limit: Maximum number of descriptors to return
+    :return: List of matching MeSH descriptor objects, or None if the query was unsuccessful
     """
-    result = {}
+    result = None
 
-    api_query_params = {'label': descriptor_label, 'match': 'exact', 'limit': 10}
-    response = None
+    api_query_params = {'label': descriptor_label, 'match': match, 'limit': limit}
     try:
-        response = requests.get('https://id.nlm.nih.gov/mesh/lookup/descriptor', params=api_query_params, timeout=10)
+        started = time.monotonic()
+        response_context = http_get(session, 'https://id.nlm.nih.gov/mesh/lookup/descriptor', params=api_query_params)
+        async with response_context as response:
+            if response.status == HTTPStatus.OK:
+                result = orjson.loads(await response.read())
+                logging.debug('Call to https://id.nlm.nih.gov/mesh/lookup/descriptor took {seconds} seconds'
+                              .format(seconds=time.monotonic() - started))
     except Exception as exc:
         logging.error(exc)
-    if response and response.status_code == requests.codes.ok:
-        logging.debug('Call to https://id.nlm.nih.gov/mesh/lookup/descriptor took {seconds} seconds'
-                      .format(seconds=response.elapsed))
+    return result
+
 
+async def fetch_mesh_descriptor(session, descriptor_label):
+    """
+    Fetches the Medical Subject Heading (MeSH) descriptor for the provided descriptor label from the NIH MeSH service.
+    Should there be no exact match, the first descriptor whose label contains the provided label is used instead.
+    Resolved descriptors are cached by the normalized provided label and by their own normalized label, and unknown
+    labels are recorded as provided.
+    :param session: HTTP client session
+    :param descriptor_label: Speculative name of a descriptor label
+    :return: MeSH descriptor object if the descriptor label is know, otherwise empty dict
+    """
+    cache_key = normalize_label(descriptor_label)
+    if cache_key in Mesh_descriptor_cache:
+        return Mesh_descriptor_cache[cache_key]
+    if descriptor_label in Mesh_unknown_labels:
+        return {}
+
+    result = {}
+
+    mesh_descriptors = await lookup_mesh_descriptors(session, descriptor_label, 'exact', 10)
+    if mesh_descriptors == []:
+        mesh_descriptors = await lookup_mesh_descriptors(session, descriptor_label, 'contains', 1)
+    if mesh_descriptors is not None:
         # If a JSON object is found then return it directly:
-        response_json = response.json()
-        if response_json:
-            result = response_json[0]
+        if mesh_descriptors:
+            result = mesh_descriptors[0]
+            Mesh_descriptor_cache[normalize_label(result['label'])] = result
+            Mesh_descriptor_cache[cache_key] = result
+        else:
+            Mesh_unknown_labels.add(descriptor_label)
     return result
 
 
-def is_mesh_disease(mesh_descriptor):
+async def classify_mesh_diseases(session, descriptor_ids):
     """
-    Queries the NIH MeSH RDF service to test if the provided MeSH descriptor represents a known disease.
-    :param mesh_descriptor: MeSH Descriptor of a speculative disease
-    :return: True if the descriptor represents a known disease
+    Tests which of the provided MeSH descriptors represent known diseases.  A descriptor represents a disease if any of
+    its tree numbers is in the MeSH Diseases tree.  Descriptors are looked up in the local MeSH tree index, and any not
+    found there are queried in batches from the NIH MeSH RDF service.  The results are recorded in the disease
+    classification cache.
+    :param session: HTTP client session
+    :param descriptor_ids: MeSH descriptor IDs of speculative diseases
     """
-    result = False
-
-    match = Descriptor_id_regex.search(mesh_descriptor['resource'])
-    if match:
-        descriptor_id = match.group(1)
-        sparql_query = Treenum_query_template.format(descriptor_id=descriptor_id)
-        api_query_params = {'query': sparql_query}
-        response = None
+    uncached_ids = []
+    for descriptor_id in sorted(set(descriptor_ids)):
+        if descriptor_id in Mesh_tree:
+            Mesh_disease_cache[descriptor_id] = any(
+                tree_number.startswith('C') for tree_number in Mesh_tree[descriptor_id])
+        elif descriptor_id not in Mesh_disease_cache:
+            uncached_ids.append(descriptor_id)
+    for batch_offset in range(0, len(uncached_ids), Treenum_query_batch_size):
+        batch_ids = uncached_ids[batch_offset:batch_offset + Treenum_query_batch_size]
+        descriptors = ' '.join('mesh:{descriptor_id}'.format(descriptor_id=descriptor_id)
+                               for descriptor_id in batch_ids)
+        # Collect the base trees of each descriptor's tree numbers and test them against the MeSH Diseases tree.  The
+        # service caps the rows returned per query, so results are read page by page until a short page, and only
+        # recorded once all pages have been read:
+        batch_results = dict.fromkeys(batch_ids, False)
+        page_offset = 0
+        complete = False
         try:
-            response = requests.get('https://id.nlm.nih.gov/mesh/sparql', params=api_query_params, timeout=10)
+            while not complete:
+                sparql_query = Treenum_query_template.format(
+                    descriptors=descriptors, limit=Treenum_query_page_size, offset=page_offset)
+                api_query_params = {'query': sparql_query}
+                page_rows = 0
+                started = time.monotonic()
+                response_context = http_get(session, 'https://id.nlm.nih.gov/mesh/sparql', params=api_query_params)
+                async with response_context as response:
+                    if response.status != HTTPStatus.OK:
+                        break
+                    # Parse result elements as the response streams in, discarding each once tested:
+                    parser = ET.XMLPullParser(['end'], tag=Sparql_result_tag, **Xml_parser_options)
+                    async for chunk in response.content.iter_chunked(Stream_chunk_size):
+                        parser.feed(chunk)
+                        for _, result_node in parser.read_events():
+                            page_rows += 1
+                            descriptor_match = Descriptor_id_regex.search(Sparql_descriptor_uri_xpath(result_node))
+                            base_tree_match = Base_tree_regex.search(Sparql_treenum_uri_xpath(result_node))
+                            if descriptor_match and base_tree_match and base_tree_match.group(1).startswith('C'):
+                                batch_results[descriptor_match.group(1)] = True
+                            result_node.clear()
+                    parser.close()
+                    logging.debug('Call to https://id.nlm.nih.gov/mesh/sparql took {seconds} seconds'
+                                  .format(seconds=time.monotonic() - started))
+                complete = page_rows < Treenum_query_page_size
+                page_offset += page_rows
         except Exception as exc:
             logging.error(exc)
-        if response and response.status_code == requests.codes.ok:
-            logging.debug('Call to https://id.nlm.nih.gov/mesh/sparql took {seconds} seconds'
-                          .format(seconds=response.elapsed))
-
-            # Find the first descriptor tree number in the XML response and test if it is in the MeSH Diseases tree:
-            content_stringed = response.content.decode()
-            xml_root = ET.fromstring(content_stringed)
-            treenum_uri_nodes = xml_root.findall(
-                ".//"
-                "{http://www.w3.org/2005/sparql-results#}binding[@name='treeNum']/"
-                "{http://www.w3.org/2005/sparql-results#}uri")
-            if bool(treenum_uri_nodes):
-                treenum_id = treenum_uri_nodes[0].text
-                match = Base_tree_regex.search(treenum_id)
-                if match:
-                    base_tree = match.group(1)
-                    if base_tree.startswith('C'):
-                        result = True
+        if complete:
+            Mesh_disease_cache.update(batch_results)
+
+
+async def fetch_mesh_diseases(session, descriptor_labels):
+    """
+    Resolves the provided descriptor labels to MeSH descriptors and tests whether they represent known diseases.
+    Labels already known to be MeSH disease descriptor labels are accepted as they are.  Other descriptors are fetched
+    concurrently, once per distinct spelling of a normalized label, and then classified with as few MeSH RDF service
+    queries as possible.
+    :param session: HTTP client session
+    :param descriptor_labels: Speculative names of descriptor labels
+    :return: Dict mapping each descriptor label to a tuple of the MeSH descriptor label, or None if the descriptor
+    label is not known, and whether the descriptor represents a known disease
+    """
+    result = {descriptor_label: (descriptor_label, True) for descriptor_label in descriptor_labels
+              if descriptor_label in Mesh_disease_labels}
+    unresolved_labels = [descriptor_label for descriptor_label in descriptor_labels if descriptor_label not in result]
+
+    # Group the distinct spellings of each normalized label, as the fetches all start before any is cached.  Spellings
+    # within a group are fetched in turn, so that once one resolves the rest are served from the cache, and spellings
+    # that do not resolve themselves take the group's resolved descriptor:
+    spelling_groups = {}
+    for descriptor_label in unresolved_labels:
+        spellings = spelling_groups.setdefault(normalize_label(descriptor_label), [])
+        if descriptor_label not in spellings:
+            spellings.append(descriptor_label)
+
+    async def fetch_spelling_group(spellings):
+        group_descriptors = [await fetch_mesh_descriptor(session, descriptor_label) for descriptor_label in spellings]
+        resolved_descriptor = next((mesh_descriptor for mesh_descriptor in group_descriptors if mesh_descriptor), {})
+        return {descriptor_label: mesh_descriptor or resolved_descriptor
+                for descriptor_label, mesh_descriptor in zip(spellings, group_descriptors)}
+
+    fetched_descriptors = {}
+    for group_descriptors in await asyncio.gather(*[fetch_spelling_group(spellings)
+                                                    for spellings in spelling_groups.values()]):
+        fetched_descriptors.update(group_descriptors)
+    mesh_descriptors = [fetched_descriptors[descriptor_label] for descriptor_label in unresolved_labels]
+    descriptor_ids = {}
+    for descriptor_label, mesh_descriptor in zip(unresolved_labels, mesh_descriptors):
+        match = Descriptor_id_regex.search(mesh_descriptor['resource']) if mesh_descriptor else None
+        if match:
+            descriptor_ids[descriptor_label] = match.group(1)
+    await classify_mesh_diseases(session, descriptor_ids.values())
+
+    for descriptor_label, mesh_descriptor in zip(unresolved_labels, mesh_descriptors):
+        mesh_label = mesh_descriptor['label'] if mesh_descriptor else None
+        if mesh_label is not None and normalize_label(mesh_label) != normalize_label(descriptor_label):
+            # A containing match stands in for the supplied label, so make the substitution visible:
+            logging.warning('[{descriptor_label}] has no exact MeSH descriptor match; substituting [{mesh_label}]'
+                            .format(descriptor_label=descriptor_label, mesh_label=mesh_label))
+        descriptor_id = descriptor_ids.get(descriptor_label)
+        is_disease = Mesh_disease_cache.get(descriptor_id, False)
+        if is_disease:
+            Mesh_disease_labels[mesh_label] = descriptor_id
+        result[descriptor_label] = (mesh_label, is_disease)
     return result
 
 
-def count_channel_items(feed_url, disease_name, inactivity_period_days):
+async def count_channel_items(session, feed_url, disease_name, inactivity_period_days, exists_only=False):
     """
-    Counts the disease-related channel items of the specified RSS feed. 
+    Counts the disease-related channel items of the specified RSS feed.  The response is parsed as it streams in.  If
+    the feed has been queried before, the request is made conditional on the response having changed and, if it has
+    not, the previous count is returned.
+    :param session: HTTP client session
     :param feed_url: URL of the RSS feed
     :param disease_name: Name of the disease
     :param inactivity_period_days: Inactivity period threshold in days
+    :param exists_only: If True, request a single channel item and stop reading the response once it is found
     :return: A tuple containing the qualifying channel item count and the value certainty. If the count is zero and
     certainty is True then there were no channel items found. If the count is zero and the certainty is False then
     the actual count is unknown due to an unsuccessful query.
     """
     count = 0
     certainty = False
-    if feed_url not in FeedQueryParams:
-        logging.error('No query params found for feed [{feed_url}] while checking [{disease_name}]'
+    feed_handler = FeedHandlers.get(feed_url)
+    if feed_handler is None:
+        logging.error('No handler found for feed [{feed_url}] while checking [{disease_name}]'
                       .format(feed_url=feed_url, disease_name=disease_name))
     else:
-        api_query_params = FeedQueryParams[feed_url].format(
-            disease=disease_name, inactivity_period_days=inactivity_period_days, limit=1000)
-        response = None
+        api_query_params = feed_handler['params'](
+            disease=disease_name, inactivity_period_days=inactivity_period_days,
+            limit=1 if exists_only else Feed_item_limit)
+        item_path = feed_handler['item_path']
+
+        cache_key = '{feed_url}?{params}'.format(feed_url=feed_url, params=api_query_params)
+        cached = Feed_cache.get(cache_key)
+        request_headers = {}
+        if cached:
+            if cached['etag']:
+                request_headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                request_headers['If-Modified-Since'] = cached['last_modified']
         try:
-            response = requests.get(feed_url, params=api_query_params, timeout=10)
+            started = time.monotonic()
+            async with http_get(session, feed_url, params=api_query_params, headers=request_headers) as response:
+                if response.status == HTTPStatus.NOT_MODIFIED and request_headers:
+                    count, certainty = cached['count'], True
+                    logging.debug('Call to {feed_url} took {seconds} seconds; not modified'
+                                  .format(feed_url=feed_url, seconds=time.monotonic() - started))
+                elif response.status == HTTPStatus.OK:
+                    # Search XML response for channel items, tracking the element path so that only elements at the
+                    # feed's item path are counted and discarding each one once counted:
+                    parser = ET.XMLPullParser(['start', 'end'], **Xml_parser_options)
+                    element_path = []
+                    item_count = 0
+                    async for chunk in response.content.iter_chunked(Stream_chunk_size):
+                        parser.feed(chunk)
+                        for event, element in parser.read_events():
+                            if event == 'start':
+                                element_path.append(element.tag)
+                            else:
+                                if element_path[1:] == item_path:
+                                    item_count += 1
+                                    element.clear()
+                                element_path.pop()
+                        if exists_only and item_count > 0:
+                            break
+                    else:
+                        parser.close()
+                    count, certainty = item_count, True
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if etag or last_modified:
+                        Feed_cache[cache_key] = {'etag': etag, 'last_modified': last_modified, 'count': count}
+                    logging.debug('Call to {feed_url} took {seconds} seconds'
+                                  .format(feed_url=feed_url, seconds=time.monotonic() - started))
         except Exception as exc:
             logging.error(exc)
-        if response and response.status_code == requests.codes.ok:
-            logging.debug('Call to {feed_url} took {seconds} seconds'
-                          .format(feed_url=feed_url, seconds=response.elapsed))
-
-            # Search XML response for existence of channel items:
-            content_stringed = response.content.decode()
-            xml_root = ET.fromstring(content_stringed)
-            item_pubdate_nodes = xml_root.findall('./channel/item')
-            count = len(item_pubdate_nodes)
-            certainty = True
     return count, certainty
 
 
-# A custom iterator capable of being preempted early.
-class SmartIterator(collections.Iterable):
-    class __Inner:
-        __underlying_iterator = None
-        __stop = False
-
-        def __init__(self, iterable):
-            self.__underlying_iterator = iterable.__iter__()
-
-        def __next__(self):
-            if self.__stop:
-                raise StopIteration
-            else:
-                return self.__underlying_iterator.__next__()
-
-        def stop(self):
-            self.__stop = True
-
-    __iterable = None
-    _inner = None
-
-    def __init__(self, iterable):
-        self.__iterable = iterable
-
-    def __iter__(self):
-        self._inner = SmartIterator.__Inner(self.__iterable)
-        return self._inner
-
-
-# SmartIterator for use by feed iteration.
-class FeedsIterator(SmartIterator):
-    def __call__(self, channel_items):
-        count, _ = channel_items
-        if count > 0:
-            self._inner.stop()
-        return channel_items
-
-
-def check_disease_feeds(disease_name, feed_urls, inactivity_period_days):
+async def check_disease_feeds(session, disease_name, feed_urls, inactivity_period_days):
     """
     Check provided RSS feeds for disease-related channel items.
+    :param session: HTTP client session
     :param disease_name: Name of disease topic
     :param feed_urls: List of feed URLs
     :param inactivity_period_days: Inactivity period threshold in days
     """
-    # Map RSS feed activity to list of (channel item count, certainty) tuples.  We augment the list comprehension
-    # with a "smart" iterator so that evaluation of subsequent feeds can be avoided should a preceding feed be found
-    # to contain activity, satisfying the per-disease test.
-    feeder = FeedsIterator(feed_urls)
-    activity = [feeder(count_channel_items(feed_url, disease_name, inactivity_period_days)) for feed_url in feeder]
-    # Sum list of (channel item count, certainty) tuples. Note that uncertainty is propagated:
-    channel_items_total, is_certain = reduce((lambda acc, arg: (acc[0] + arg[0], acc[1] and arg[1])), activity)
+    # Query all feeds concurrently and sum their (channel item count, certainty) results in order of completion, noting
+    # that uncertainty is propagated.  Should a feed be found to contain activity, satisfying the per-disease test, the
+    # queries still outstanding are cancelled.
+    tasks = [asyncio.ensure_future(count_channel_items(session, feed_url, disease_name, inactivity_period_days,
+                                                       exists_only=True))
+             for feed_url in feed_urls]
+    # Without any feeds to check, inactivity cannot be determined with certainty:
+    channel_items_total, is_certain = 0, bool(feed_urls)
+    try:
+        for next_completed in asyncio.as_completed(tasks):
+            count, certainty = await next_completed
+            channel_items_total += count
+            is_certain = is_certain and certainty
+            if count > 0:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     # Log inactivity results:
     if channel_items_total == 0:
         if is_certain:
@@ -242,34 +707,54 @@ def check_disease_feeds(disease_name, feed_urls, inactivity_period_days):
                          .format(disease_name=disease_name))
 
 
-def check_disease_activity(work_unit, inactivity_period_days):
+async def check_disease_activity(session, work_unit, mesh_disease, inactivity_period_days):
     """
     Evaluate a disease activity check unit of work.
+    :param session: HTTP client session
     :param work_unit: Disease activity check unit of work
+    :param mesh_disease: Tuple of the MeSH descriptor label matching the work unit's speculative disease name, if any,
+    and whether the descriptor represents a known disease
     :param inactivity_period_days: Inactivity period threshold in days
     """
     disease_name, feed_urls = work_unit
-    # Attempt to match speculative disease name with MeSH descriptor of a recognized disease:
-    mesh_descriptor = fetch_mesh_descriptor(disease_name)
-    if not bool(mesh_descriptor) or not is_mesh_disease(mesh_descriptor):
+    mesh_disease_name, is_disease = mesh_disease
+    if mesh_disease_name is None or not is_disease:
         logging.warning("[{disease_name}] is not a recognized MeSH disease descriptor name; skipping"
                         .format(disease_name=disease_name))
     else:
         # Proceed with checking feeds assuming MeSH disease name as working name:
-        mesh_disease_name = mesh_descriptor['label']
-        check_disease_feeds(mesh_disease_name, feed_urls, inactivity_period_days)
+        await check_disease_feeds(session, mesh_disease_name, feed_urls, inactivity_period_days)
 
 
-def log_disease_inactivity(work_units, inactivity_period_days):
+async def log_disease_inactivity(work_units, inactivity_period_days):
     """
-    Main workflow entry point.
+    Main workflow entry point.  Speculative disease names are first matched to MeSH diseases in bulk, after which
+    units of work are evaluated concurrently, up to a fixed limit, over a shared HTTP client session.
     :param work_units: List of work unit tuples containing speculative disease names and associated RSS feed URLS
     :param inactivity_period_days: Inactivity period threshold in days
     """
     logging.info('Begin checking disease RSS feed activity; inactivity period = {period} days'
                  .format(period=inactivity_period_days))
-    for work_unit in work_units:
-        check_disease_activity(work_unit, inactivity_period_days)
+    timeout = aiohttp.ClientTimeout(total=Request_timeout_seconds)
+    connector = aiohttp.TCPConnector(limit_per_host=Connections_per_host)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=Request_headers) as session:
+        if not load_mesh_tree():
+            await refresh_mesh_tree(session)
+        revalidate_mesh_disease_labels()
+        # Attempt to match speculative disease names with MeSH descriptors of recognized diseases:
+        mesh_diseases = await fetch_mesh_diseases(session, [disease_name for disease_name, _ in work_units])
+        work_unit_slots = asyncio.Semaphore(Max_concurrent_work_units)
+
+        async def check_disease_activity_in_slot(work_unit):
+            async with work_unit_slots:
+                await check_disease_activity(session, work_unit, mesh_diseases[work_unit[0]], inactivity_period_days)
+
+        tasks = [check_disease_activity_in_slot(work_unit) for work_unit in work_units]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    for (disease_name, _), result in zip(work_units, results):
+        if isinstance(result, Exception):
+            logging.error('Unexpected error while checking [{disease_name}]: {exc}'
+                          .format(disease_name=disease_name, exc=result))
     logging.info('End checking disease RSS feed activity')
 
 
@@ -287,6 +772,11 @@ def main(argv):
 
     logging.basicConfig(level=log_level)
 
+    load_mesh_cache()
+    atexit.register(save_mesh_cache)
+    load_feed_cache()
+    atexit.register(save_feed_cache)
+
     sample_work_units = [
         # Case with currently active channel items:
         ('Alzheimer Disease', ['https://clinicaltrials.gov/ct2/results/rss.xml']),
@@ -300,7 +790,7 @@ def main(argv):
         ('Crohn Disease', ['https://clinicaltrials.gov/ct2/results/rss.xml', 'https://clinicaltrials.gov/ct2/results/rss.xml']),
     ]
 
-    log_disease_inactivity(sample_work_units, inactivity_period_days=14)
+    asyncio.run(log_disease_inactivity(sample_work_units, inactivity_period_days=14))
 
 
 if __name__ == '__main__':